@@ -20,6 +20,10 @@ python wilson_ci.py --conf 0.95 --digits 1 --as-percent "Q6. Samartphone-based (
 Notes:
 - Wilson interval is recommended for small samples and proportions near 0/1.
 - For 95% CI, z ≈ 1.959963984540054 (normal quantile).
+- The module type-checks under mypy --strict and can be compiled with mypyc
+  (`mypyc wilson_ci.py`). `python wilson_ci.py` always runs this source
+  file; the compiled extension is picked up by `import wilson_ci`, e.g.
+  `python -c "import sys, wilson_ci; sys.exit(wilson_ci.main(sys.argv[1:]))" ...`
 
  Note (personal check): Results were spot-checked against
  https://www.statskingdom.com/proportion-confidence-interval-calculator.html
@@ -34,7 +38,11 @@ import math
 import re
 import sys
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, Tuple
+
+
+_FRAC_RE = re.compile(r"(\d+)\s*/\s*(\d+)")
 
 
 @dataclass(frozen=True)
@@ -44,68 +52,98 @@ class Result:
     n: int
 
 
+_STD_NORMAL: Optional[NormalDist]
+try:
+    from statistics import NormalDist
+
+    _STD_NORMAL = NormalDist()
+except ImportError:  # Python < 3.8
+    _STD_NORMAL = None
+
+
+@lru_cache(maxsize=8)
 def normal_quantile(p: float) -> float:
     """
     Inverse CDF (quantile) for standard normal distribution.
-    Uses math.erfcinv if available; otherwise uses a rational approximation.
+    Uses statistics.NormalDist.inv_cdf if available; otherwise uses a rational approximation.
 
     This implementation avoids external dependencies.
     """
-    # Use an accurate rational approximation (Peter J. Acklam) for inverse normal CDF.
-    # Reference: https://web.archive.org/web/20150910044729/http://home.online.no/~pjacklam/notes/invnorm/
     if not (0.0 < p < 1.0):
         raise ValueError("p must be in (0, 1)")
-
-    # Coefficients in rational approximations
-    a = [
-        -3.969683028665376e+01,
-        2.209460984245205e+02,
-        -2.759285104469687e+02,
-        1.383577518672690e+02,
-        -3.066479806614716e+01,
-        2.506628277459239e+00,
-    ]
-    b = [
-        -5.447609879822406e+01,
-        1.615858368580409e+02,
-        -1.556989798598866e+02,
-        6.680131188771972e+01,
-        -1.328068155288572e+01,
-    ]
-    c = [
-        -7.784894002430293e-03,
-        -3.223964580411365e-01,
-        -2.400758277161838e+00,
-        -2.549732539343734e+00,
-        4.374664141464968e+00,
-        2.938163982698783e+00,
-    ]
-    d = [
-        7.784695709041462e-03,
-        3.224671290700398e-01,
-        2.445134137142996e+00,
-        3.754408661907416e+00,
-    ]
+    if _STD_NORMAL is not None:
+        return _STD_NORMAL.inv_cdf(p)
+    return _acklam_quantile(p)
+
+
+# Coefficients in rational approximations (Peter J. Acklam)
+_ACKLAM_A = (
+    -3.969683028665376e+01,
+    2.209460984245205e+02,
+    -2.759285104469687e+02,
+    1.383577518672690e+02,
+    -3.066479806614716e+01,
+    2.506628277459239e+00,
+)
+_ACKLAM_B = (
+    -5.447609879822406e+01,
+    1.615858368580409e+02,
+    -1.556989798598866e+02,
+    6.680131188771972e+01,
+    -1.328068155288572e+01,
+)
+_ACKLAM_C = (
+    -7.784894002430293e-03,
+    -3.223964580411365e-01,
+    -2.400758277161838e+00,
+    -2.549732539343734e+00,
+    4.374664141464968e+00,
+    2.938163982698783e+00,
+)
+_ACKLAM_D = (
+    7.784695709041462e-03,
+    3.224671290700398e-01,
+    2.445134137142996e+00,
+    3.754408661907416e+00,
+)
+
+
+def _acklam_quantile(
+    p: float,
+    _sqrt: Callable[[float], float] = math.sqrt,
+    _log: Callable[[float], float] = math.log,
+) -> float:
+    """
+    Rational approximation of the standard normal quantile, used on
+    Pythons without statistics.NormalDist.
+    _sqrt/_log are bound as defaults so the tail branches use local lookups.
+    """
+    # Use an accurate rational approximation (Peter J. Acklam) for inverse normal CDF.
+    # Reference: https://web.archive.org/web/20150910044729/http://home.online.no/~pjacklam/notes/invnorm/
 
     # Define break-points
     plow = 0.02425
     phigh = 1 - plow
 
-    if p < plow:
-        q = math.sqrt(-2 * math.log(p))
-        num = (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5])
-        den = ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1)
-        return num / den
-    if p > phigh:
-        q = math.sqrt(-2 * math.log(1 - p))
-        num = -(((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5])
-        den = ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1)
-        return num / den
-
+    if p < plow or p > phigh:
+        c0, c1, c2, c3, c4, c5 = _ACKLAM_C
+        d0, d1, d2, d3 = _ACKLAM_D
+        if p < plow:
+            q = _sqrt(-2 * _log(p))
+            sign = 1.0
+        else:
+            q = _sqrt(-2 * _log(1 - p))
+            sign = -1.0
+        num = (((((c0 * q + c1) * q + c2) * q + c3) * q + c4) * q + c5)
+        den = ((((d0 * q + d1) * q + d2) * q + d3) * q + 1)
+        return sign * num / den
+
+    a0, a1, a2, a3, a4, a5 = _ACKLAM_A
+    b0, b1, b2, b3, b4 = _ACKLAM_B
     q = p - 0.5
     r = q * q
-    num = (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q
-    den = (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+    num = (((((a0 * r + a1) * r + a2) * r + a3) * r + a4) * r + a5) * q
+    den = (((((b0 * r + b1) * r + b2) * r + b3) * r + b4) * r + 1)
     return num / den
 
 
@@ -118,21 +156,61 @@ def wilson_ci(k: int, n: int, conf: float = 0.95) -> Tuple[float, float]:
         raise ValueError("n must be > 0")
     if not (0 <= k <= n):
         raise ValueError("k must be between 0 and n")
+    return wilson_ci_many([k], [n], conf=conf)[0]
+
+
+def wilson_ci_many(
+    ks: Sequence[int], ns: Sequence[int], conf: float = 0.95
+) -> List[Tuple[float, float]]:
+    """
+    Wilson score intervals for many binomial proportions in one pass.
+    Returns one (low, high) pair per (k, n), as proportions in [0,1].
+    """
+    if len(ks) != len(ns):
+        raise ValueError("ks and ns must have the same length")
     if not (0.0 < conf < 1.0):
         raise ValueError("conf must be in (0,1)")
 
+    bad = [i for i, (k, n) in enumerate(zip(ks, ns)) if not (0 <= k <= n and n > 0)]
+    if bad:
+        raise ValueError(f"invalid rows {bad}: need n > 0 and 0 <= k <= n")
+
     alpha = 1.0 - conf
     z = normal_quantile(1.0 - alpha / 2.0)
 
+    return [_wilson_ci_from_z(k, n, z) for k, n in zip(ks, ns)]
+
+
+@lru_cache(maxsize=256)
+def _wilson_ci_from_z(k: int, n: int, z: float) -> Tuple[float, float]:
+    """
+    Wilson score interval for a precomputed normal quantile z.
+    Callers are expected to have validated k, n and conf already.
+    Cached, since survey tables repeat the same k/n under different labels.
+    """
+    z2_n = z * z / n
+    inv_denom = 1.0 / (1.0 + z2_n)
+
+    # At phat = 0 or 1 the interval reduces to [0, z^2/(n+z^2)] or [n/(n+z^2), 1]
+    if k == 0:
+        return 0.0, z2_n * inv_denom
+    if k == n:
+        return inv_denom, 1.0
+
     phat = k / n
-    z2 = z * z
 
-    denom = 1.0 + z2 / n
-    center = (phat + z2 / (2.0 * n)) / denom
-    half_width = (z * math.sqrt((phat * (1.0 - phat) + z2 / (4.0 * n)) / n)) / denom
+    # low/high = (center -/+ half_width) / denom, sharing one reciprocal
+    center = phat + 0.5 * z2_n
+    half_width = z * math.sqrt((phat * (1.0 - phat) + 0.25 * z2_n) / n)
 
-    low = max(0.0, center - half_width)
-    high = min(1.0, center + half_width)
+    low = (center - half_width) * inv_denom
+    high = (center + half_width) * inv_denom
+
+    # Clip to [0,1]
+    if low < 0.0:
+        low = 0.0
+    if high > 1.0:
+        high = 1.0
     return low, high
 
 
@@ -144,19 +222,26 @@ def parse_result(s: str) -> Result:
       "Wearables preferred = 26 / 42"
     """
     s = s.strip()
-    if "=" not in s:
+    label, sep, frac = s.partition("=")
+    if not sep:
         raise ValueError(f"Missing '=' in '{s}'. Expected format: Label=k/n")
 
-    label, frac = s.split("=", 1)
     label = label.strip()
     frac = frac.strip()
 
-    m = re.fullmatch(r"(\d+)\s*/\s*(\d+)", frac)
-    if not m:
-        raise ValueError(f"Bad fraction '{frac}' in '{s}'. Expected k/n like 28/42")
-
-    k = int(m.group(1))
-    n = int(m.group(2))
+    # Fast path for the usual "k/n" form; the regex is only a fallback.
+    k_s, slash, n_s = frac.partition("/")
+    k_s = k_s.rstrip()
+    n_s = n_s.lstrip()
+    if slash and k_s.isdecimal() and n_s.isdecimal():
+        k = int(k_s)
+        n = int(n_s)
+    else:
+        m = _FRAC_RE.fullmatch(frac)
+        if not m:
+            raise ValueError(f"Bad fraction '{frac}' in '{s}'. Expected k/n like 28/42")
+        k = int(m.group(1))
+        n = int(m.group(2))
     if n <= 0:
         raise ValueError(f"n must be > 0 in '{s}'")
     if k < 0 or k > n:
@@ -222,34 +307,41 @@ def main(argv: List[str]) -> int:
     else:
         header = ["Label", "k", "n", "%", f"Wilson {int(args.conf*100)}% CI [low, high]"]
 
+    # Build the number formats once rather than re-parsing a nested format spec per cell
+    p_spec = "{:." + str(args.digits) + "f}"
+    if use_prop:
+        scale = 1.0
+        ci_spec = "[" + p_spec + ", " + p_spec + "]"
+    else:
+        scale = 100.0
+        ci_spec = "[" + p_spec + "%, " + p_spec + "%]"
+
+    intervals = wilson_ci_many([r.k for r in parsed], [r.n for r in parsed], conf=args.conf)
+
+    col_widths = [len(h) for h in header]
     rows = []
-    for r in parsed:
-        low, high = wilson_ci(r.k, r.n, conf=args.conf)
+    for r, (low, high) in zip(parsed, intervals):
         phat = r.k / r.n
 
-        if use_prop:
-            p_str = f"{phat:.{args.digits}f}"
-            ci_str = f"[{low:.{args.digits}f}, {high:.{args.digits}f}]"
-        else:
-            p_str = fmt_percent(phat, args.digits)
-            ci_str = f"[{fmt_percent(low, args.digits)}%, {fmt_percent(high, args.digits)}%]"
-
-        rows.append([r.label, str(r.k), str(r.n), p_str, ci_str])
+        p_str = p_spec.format(phat * scale)
+        ci_str = ci_spec.format(low * scale, high * scale)
 
-    # Pretty print as fixed-width table
-    col_widths = [len(h) for h in header]
-    for row in rows:
+        row = [r.label, str(r.k), str(r.n), p_str, ci_str]
         for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(cell))
+            w = len(cell)
+            if w > col_widths[i]:
+                col_widths[i] = w
+        rows.append(row)
 
-    def print_row(cells: List[str]) -> None:
-        line = "  ".join(cell.ljust(col_widths[i]) for i, cell in enumerate(cells))
-        print(line)
-
-    print_row(header)
-    print_row(["-" * w for w in col_widths])
-    for row in rows:
-        print_row(row)
+    # Pretty print as fixed-width table
+    # Collect every padded cell and separator into one flat list, then join once
+    parts: List[str] = []
+    for cells in [header, ["-" * w for w in col_widths], *rows]:
+        for w, cell in zip(col_widths, cells):
+            parts.append(cell.ljust(w))
+            parts.append("  ")
+        parts[-1] = "\n"
+    sys.stdout.write("".join(parts))
 
     return 0
 